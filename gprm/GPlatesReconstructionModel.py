@@ -84,7 +84,7 @@ class ReconstructionModel(object):
 
     def __init__(self, name=None):
         self.name = name
-        self.rotation_model = []    # creates a new empty list for each
+        self._rotation_model = []    # creates a new empty list for each
         self.rotation_files = []
         self.static_polygons = []
         self.static_polygon_files = []
@@ -95,6 +95,19 @@ class ReconstructionModel(object):
         self.continent_polygons = []
         self.continent_polygons_files = []
 
+    @property
+    def rotation_model(self):
+        # The pygplates.RotationModel is built lazily on first access and
+        # cached, so that the rotation files are parsed only once however
+        # many snapshots or velocity fields are generated from this model
+        if self._rotation_model is None:
+            self._rotation_model = pygplates.RotationModel(self.rotation_files)
+        return self._rotation_model
+
+    @rotation_model.setter
+    def rotation_model(self, value):
+        self._rotation_model = value
+
     def info(self, show_full_paths=False):
 
         print('Name: {:s}'.format(self.name))
@@ -125,11 +138,12 @@ class ReconstructionModel(object):
             raise ValueError('Unable to find file {:s}'.format(rotation_file))
 
         if replace:
-            self.rotation_model = []
             self.rotation_files = []
 
         self.rotation_files.append(rotation_file)
-        self.rotation_model = pygplates.RotationModel(self.rotation_files)
+        # invalidate any previously built rotation model; it will be rebuilt
+        # (once) the next time it is needed
+        self._rotation_model = None
 
     def add_static_polygons(self, static_polygons_file, replace=False):
         """
@@ -345,15 +359,64 @@ class PlateSnapshot(object):
         self.rotation_model = rotation_model
         self.resolved_topologies = resolved_topologies
         self.resolved_topological_sections = resolved_topological_sections
+        self._plate_partitioner = None
+        self._bounding_circles_cache = None
         self.plate_count = len(resolved_topologies)
-        self.plate_ids = [resolved_topology.get_resolved_feature().get_reconstruction_plate_id() \
-                          for resolved_topology in resolved_topologies]
-        self.plate_areas = [resolved_topology.get_resolved_geometry().get_area() * pygplates.Earth.mean_radius_in_kms**2\
-                            for resolved_topology in resolved_topologies]
-        self.plate_perimeters = [resolved_topology.get_resolved_geometry().get_arc_length() * pygplates.Earth.mean_radius_in_kms\
-                            for resolved_topology in resolved_topologies]
-        self.plate_centroids = [resolved_topology.get_resolved_geometry().get_interior_centroid()\
-                                for resolved_topology in resolved_topologies]
+
+        # Gather the per-plate attributes in a single pass over the resolved
+        # topologies, stored as numpy arrays so that downstream queries
+        # (sums, sorting, masking) are vectorized
+        earth_radius = pygplates.Earth.mean_radius_in_kms
+        self.plate_ids = np.empty(self.plate_count, dtype=int)
+        self.plate_areas = np.empty(self.plate_count)
+        self.plate_perimeters = np.empty(self.plate_count)
+        self.plate_centroids = [None] * self.plate_count
+        self._is_network = np.zeros(self.plate_count, dtype=bool)
+        for i,resolved_topology in enumerate(resolved_topologies):
+            resolved_geometry = resolved_topology.get_resolved_geometry()
+            self._is_network[i] = isinstance(resolved_topology, pygplates.ResolvedTopologicalNetwork)
+            self.plate_ids[i] = resolved_topology.get_resolved_feature().get_reconstruction_plate_id()
+            self.plate_areas[i] = resolved_geometry.get_area() * earth_radius**2
+            self.plate_perimeters[i] = resolved_geometry.get_arc_length() * earth_radius
+            self.plate_centroids[i] = resolved_geometry.get_interior_centroid()
+
+    @property
+    def plate_partitioner(self):
+        # built lazily and cached, so that the spatial index over the resolved
+        # topologies is reused by repeated queries against the same snapshot
+        if self._plate_partitioner is None:
+            if isinstance(self.rotation_model, pygplates.RotationModel):
+                rotation_model = self.rotation_model
+            else:
+                rotation_model = pygplates.RotationModel(self.rotation_model)
+            self._plate_partitioner = pygplates.PlatePartitioner(self.resolved_topologies,
+                                                                 rotation_model)
+        return self._plate_partitioner
+
+    @property
+    def _bounding_circles(self):
+        # centroid direction and cosine of the angular radius of a small circle
+        # guaranteed to contain each resolved polygon, used to cheaply rule out
+        # polygons before any exact point-in-polygon test. Built lazily and
+        # cached for reuse across velocity field calls
+        if self._bounding_circles_cache is None:
+            centroids_xyz = np.array([centroid.to_xyz() for centroid in self.plate_centroids])
+            cos_radii = np.empty(self.plate_count)
+            for i,resolved_topology in enumerate(self.resolved_topologies):
+                lat_lon_array = resolved_topology.get_resolved_geometry().to_lat_lon_array()
+                lat = np.radians(lat_lon_array[:,0])
+                lon = np.radians(lat_lon_array[:,1])
+                vertices_xyz = np.column_stack((np.cos(lat)*np.cos(lon),
+                                                np.cos(lat)*np.sin(lon),
+                                                np.sin(lat)))
+                # radius to the most distant vertex, padded by half the longest
+                # edge since a polygon arc can bulge beyond its two endpoints
+                vertex_radius = np.arccos(np.clip(np.dot(vertices_xyz, centroids_xyz[i]).min(), -1., 1.))
+                edge_cos = np.einsum('ij,ij->i', vertices_xyz, np.roll(vertices_xyz, -1, axis=0))
+                half_max_edge = 0.5 * np.arccos(np.clip(edge_cos.min(), -1., 1.))
+                cos_radii[i] = np.cos(min(vertex_radius + half_max_edge, np.pi))
+            self._bounding_circles_cache = (centroids_xyz, cos_radii)
+        return self._bounding_circles_cache
 
     def get_boundary_features(self, boundary_types=['subduction','midoceanridge','other']):
         """
@@ -401,87 +464,99 @@ class PlateSnapshot(object):
         if velocity_domain_features is None:
             velocity_domain_features = [PointDistributionOnSphere(distribution_type='healpix',N=32).meshnode_feature]
 
-        # All domain points and associated (magnitude, azimuth, inclination) velocities for the current time.
+        # Flatten all domain points into a single list.
+        # A velocity domain feature usually has a single geometry but we'll assume it can be any number.
         all_domain_points = []
-        all_velocities_en = []
-        all_velocities_magaz = []
-        plate_ids = []
-
-        rotation_model = pygplates.RotationModel(self.rotation_model)
-
-        # Partition our velocity domain features into our topological plate polygons at the current 'time'.
-        plate_partitioner = pygplates.PlatePartitioner(self.resolved_topologies,
-                                                       rotation_model)
-
         for velocity_domain_feature in velocity_domain_features:
-
-            # A velocity domain feature usually has a single geometry but we'll assume it can be any number.
-            # Iterate over them all.
             for velocity_domain_geometry in velocity_domain_feature.get_geometries():
+                all_domain_points.extend(velocity_domain_geometry.get_points())
 
-                for velocity_domain_point in velocity_domain_geometry.get_points():
-
-                    all_domain_points.append(velocity_domain_point)
-
-                    partitioning_plate = plate_partitioner.partition_point(velocity_domain_point)
-                    if partitioning_plate:
-
-                        # We need the newly assigned plate ID to get the equivalent stage rotation of that tectonic plate.
-                        partitioning_plate_id = partitioning_plate.get_feature().get_reconstruction_plate_id()
-
-                        # Get the stage rotation of partitioning plate from 'time + delta_time' to 'time'.
-                        equivalent_stage_rotation = rotation_model.get_rotation(self.reconstruction_time,
-                                                                                partitioning_plate_id,
-                                                                                self.reconstruction_time + delta_time)
-
-                        # Calculate velocity at the velocity domain point.
-                        # This is from 'time + delta_time' to 'time' on the partitioning plate.
-                        velocity_vectors = pygplates.calculate_velocities(
-                            [velocity_domain_point],
-                            equivalent_stage_rotation,
-                            delta_time)
-
-                        # Convert global 3D velocity vectors to local (magnitude, azimuth, inclination) tuples (one tuple per point).
-                        velocities = pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down(
-                                [velocity_domain_point],
-                                velocity_vectors)
-                        all_velocities_en.append(velocities[0])
-
-                        # Convert global 3D velocity vectors to local (magnitude, azimuth, inclination) tuples (one tuple per point).
-                        velocities = pygplates.LocalCartesian.convert_from_geocentric_to_magnitude_azimuth_inclination(
-                                [velocity_domain_point],
-                                velocity_vectors)
-                        all_velocities_magaz.append(velocities[0])
-
-                        plate_ids.append(partitioning_plate_id)
-
-                    else:
-                        # If point is not within a polygon, set velocity and plate_id to zero
-                        all_velocities_en.append((0,0,0))
-                        all_velocities_magaz.append((0,0,0))
-                        plate_ids.append(0)
-
-        vel_east=[]
-        vel_north=[]
-        vel_mag = []
-        vel_azim = []
-        for velocity_vector in all_velocities_en:
-            if getattr(velocity_vector,'get_x',None) is not None:
-                vel_east.append(velocity_vector.get_y())
-                vel_north.append(velocity_vector.get_x())
-            else:
-                vel_east.append(0.)
-                vel_north.append(0.)
-
-        for velocity_vector in all_velocities_magaz:
-            vel_mag.append(velocity_vector[0])
-            vel_azim.append(velocity_vector[1])
-
-        pt_lon = []
-        pt_lat = []
-        for pt in all_domain_points:
-            pt_lon.append(pt.to_lat_lon()[1])
-            pt_lat.append(pt.to_lat_lon()[0])
+        # reuse the rotation model if it is already loaded into memory
+        if isinstance(self.rotation_model, pygplates.RotationModel):
+            rotation_model = self.rotation_model
+        else:
+            rotation_model = pygplates.RotationModel(self.rotation_model)
+
+        num_domain_points = len(all_domain_points)
+
+        # Extract all point coordinates with a single C-side conversion rather
+        # than one to_lat_lon call per point.
+        lat_lon_array = pygplates.MultiPointOnSphere(all_domain_points).to_lat_lon_array()
+        pt_lat = lat_lon_array[:,0]
+        pt_lon = lat_lon_array[:,1]
+
+        # Partition our velocity domain points into our topological plate polygons
+        # at the current 'time'. A single matmul against the bounding small
+        # circles of the resolved polygons leaves only a few candidate polygons
+        # per point for the exact (and much more expensive) point-in-polygon tests.
+        centroids_xyz,cos_radii = self._bounding_circles
+        lat_rad = np.radians(pt_lat)
+        lon_rad = np.radians(pt_lon)
+        points_xyz = np.column_stack((np.cos(lat_rad)*np.cos(lon_rad),
+                                      np.cos(lat_rad)*np.sin(lon_rad),
+                                      np.sin(lat_rad)))
+        cos_theta = points_xyz @ centroids_xyz.T
+        candidates = cos_theta >= cos_radii
+
+        resolved_polygons = [resolved_topology.get_resolved_geometry()
+                             for resolved_topology in self.resolved_topologies]
+
+        # Group the point indices by partitioning plate id, so that the velocity
+        # calculations can be made in one call per plate rather than one call
+        # per point. Points not within any polygon keep plate_id and velocity of zero.
+        point_indices_by_plate = {}
+        plate_ids = np.zeros(num_domain_points, dtype=np.int32)
+        for point_index,velocity_domain_point in enumerate(all_domain_points):
+            candidate_indices = np.nonzero(candidates[point_index])[0]
+            # match the default PlatePartitioner priority by testing resolved
+            # topological networks before rigid plates (deforming models have
+            # networks overlapping rigid polygons), then closest centroid first
+            candidate_indices = candidate_indices[np.lexsort((
+                -cos_theta[point_index,candidate_indices],
+                ~self._is_network[candidate_indices]))]
+            for polygon_index in candidate_indices:
+                if resolved_polygons[polygon_index].is_point_in_polygon(velocity_domain_point):
+                    partitioning_plate_id = int(self.plate_ids[polygon_index])
+                    point_indices_by_plate.setdefault(partitioning_plate_id, []).append(point_index)
+                    plate_ids[point_index] = partitioning_plate_id
+                    break
+
+        vel_east = np.zeros(num_domain_points)
+        vel_north = np.zeros(num_domain_points)
+        vel_mag = np.zeros(num_domain_points)
+        vel_azim = np.zeros(num_domain_points)
+
+        for partitioning_plate_id,point_indices in point_indices_by_plate.items():
+
+            # Get the stage rotation of partitioning plate from 'time + delta_time' to 'time'.
+            # The same stage rotation applies to every point on the plate.
+            equivalent_stage_rotation = rotation_model.get_rotation(self.reconstruction_time,
+                                                                    partitioning_plate_id,
+                                                                    self.reconstruction_time + delta_time)
+
+            plate_points = [all_domain_points[point_index] for point_index in point_indices]
+
+            # Calculate velocities at the domain points on this plate.
+            # This is from 'time + delta_time' to 'time' on the partitioning plate.
+            velocity_vectors = pygplates.calculate_velocities(
+                plate_points,
+                equivalent_stage_rotation,
+                delta_time)
+
+            # Convert global 3D velocity vectors to local north-east-down vectors (one per point).
+            velocities_ned = pygplates.LocalCartesian.convert_from_geocentric_to_north_east_down(
+                    plate_points,
+                    velocity_vectors)
+
+            # Convert global 3D velocity vectors to local (magnitude, azimuth, inclination) tuples (one tuple per point).
+            velocities_magaz = pygplates.LocalCartesian.convert_from_geocentric_to_magnitude_azimuth_inclination(
+                    plate_points,
+                    velocity_vectors)
+
+            vel_north[point_indices] = [velocity.get_x() for velocity in velocities_ned]
+            vel_east[point_indices] = [velocity.get_y() for velocity in velocities_ned]
+            vel_mag[point_indices] = [velocity[0] for velocity in velocities_magaz]
+            vel_azim[point_indices] = [velocity[1] for velocity in velocities_magaz]
 
         return VelocityField(pt_lat,pt_lon,vel_east,vel_north,vel_mag,vel_azim,plate_ids)
 
@@ -858,6 +933,11 @@ class VelocityField(object):
         self.velocity_magnitude = vel_mag
         self.velocity_azimuth = vel_azim
 
+        # cache array versions once, so that per-call selections in methods
+        # like rms_velocity avoid repeated list conversion
+        self._plate_ids = np.asarray(plate_ids, dtype=np.int32)
+        self._vel_mag = np.asarray(vel_mag, dtype=np.float64)
+
 
     def rms_velocity(self, plate_id_selection=None):
         """
@@ -866,16 +946,15 @@ class VelocityField(object):
         """
 
         if plate_id_selection is None:
-            return np.sqrt(np.mean(np.square(np.asarray(self.velocity_magnitude))))
+            index = slice(None)
 
-        elif type(plate_id_selection) is list:
-            index = np.array([plate_id in plate_id_selection for plate_id in self.plate_id])
+        elif np.ndim(plate_id_selection) == 0:
+            index = self._plate_ids == plate_id_selection
 
         else:
-            index = np.array([plate_id == plate_id_selection for plate_id in self.plate_id])
+            index = np.isin(self._plate_ids, np.asarray(plate_id_selection))
 
-        #print index
-        return np.sqrt(np.mean(np.square(np.asarray(self.velocity_magnitude)[index])))
+        return np.sqrt(np.mean(np.square(self._vel_mag[index])))
 
 
     def plot(self, fig, scaling=500., style="v0.1c+e", pen="0.1p,black", color="black", **kwargs):
@@ -892,6 +971,38 @@ class VelocityField(object):
 
 
 
+_sc_inputs_cache = {}
+
+def _load_subduction_convergence_inputs(rotation_files, dynamic_polygon_files):
+    # cached per worker process (see _subduction_convergence_for_time), so
+    # that each process parses the input files only once however many
+    # reconstruction times it is handed
+    key = (rotation_files, dynamic_polygon_files)
+    if key not in _sc_inputs_cache:
+        _sc_inputs_cache[key] = (pygplates.RotationModel(list(rotation_files)),
+                                 [pygplates.FeatureCollection(f) for f in dynamic_polygon_files])
+    return _sc_inputs_cache[key]
+
+
+def _subduction_convergence_for_time(args):
+    # worker for parallel subduction convergence; takes filenames rather than
+    # pygplates objects since the latter cannot be pickled across processes
+    (rotation_files, dynamic_polygon_files, threshold_sampling_distance_radians,
+     reconstruction_time, velocity_delta_time, anchor_plate_id) = args
+
+    rotation_model, dynamic_polygons = _load_subduction_convergence_inputs(rotation_files,
+                                                                           dynamic_polygon_files)
+    result = sc.subduction_convergence(
+        rotation_model,
+        dynamic_polygons,
+        threshold_sampling_distance_radians,
+        reconstruction_time,
+        velocity_delta_time,
+        anchor_plate_id)
+
+    return [data+(reconstruction_time,) for data in result]
+
+
 class SubductionConvergence(object):
     """
     Class for holding the analysis of subduction zone kinematics for a single time
@@ -901,7 +1012,8 @@ class SubductionConvergence(object):
                  reconstruction_times,
                  threshold_sampling_distance_radians,
                  velocity_delta_time=1,
-                 anchor_plate_id=0):
+                 anchor_plate_id=0,
+                 max_workers=None):
         """
         Initiate a subduction convergence object, which is essentially a pandas dataframe
         with the results of subduction kinematic analysis for a single or multiple time snapshots
@@ -911,6 +1023,11 @@ class SubductionConvergence(object):
         :param threshold_sampling_distance_radians:
         :param velocity_delta_time: (default=1)
         :param anchor_plate_id: (default=0)
+        :param max_workers: (int, optional) number of worker processes to distribute the
+            calculation across when multiple reconstruction times are given
+            (default is None, in which case the times are computed in series).
+            Requires a reconstruction model backed by files, since the workers
+            reload the rotations and dynamic polygons by filename
         """
 
         # Data frame template defining the column names
@@ -918,33 +1035,53 @@ class SubductionConvergence(object):
                              'migr_obliq','arc_length','arc_azimuth',
                              'subducting_plate','overriding_plate','time')
 
-        # Create an empty dataframe to concatenate results to
-        df_AllTimes = pd.DataFrame(columns=DataFrameTemplate)
-
         if isinstance(reconstruction_times, (float,int)):
             reconstruction_times = [reconstruction_times]
 
-        for reconstruction_time in reconstruction_times:
-
-            result = sc.subduction_convergence(
-                reconstruction_model.rotation_model,
-                reconstruction_model.dynamic_polygons,
-                threshold_sampling_distance_radians,
-                reconstruction_time,
-                velocity_delta_time,
-                anchor_plate_id)
+        if max_workers is not None and len(reconstruction_times) > 1:
+            # The time slices are independent, so fan them out across worker
+            # processes. The input files are passed by name and re-parsed
+            # (once) within each worker, since pygplates objects cannot be
+            # pickled across process boundaries
+            if not (reconstruction_model.rotation_files and reconstruction_model.dynamic_polygon_files):
+                raise ValueError('max_workers requires a reconstruction model backed by rotation '
+                                 'and dynamic polygon files; for models loaded directly into '
+                                 'memory, use the serial path (max_workers=None)')
+            from concurrent.futures import ProcessPoolExecutor
+            task_args = [(tuple(reconstruction_model.rotation_files),
+                          tuple(reconstruction_model.dynamic_polygon_files),
+                          threshold_sampling_distance_radians,
+                          reconstruction_time,
+                          velocity_delta_time,
+                          anchor_plate_id) for reconstruction_time in reconstruction_times]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_subduction_convergence_for_time, task_args))
 
-            # Make a flat list of subduction stats to input into the proximity test
-            subduction_data = []
-            for data in result:
-                subduction_data.append(data+(reconstruction_time,))
-
-            df = pd.DataFrame(subduction_data, columns = DataFrameTemplate)
-
-            # append dataframe
-            df_AllTimes = df_AllTimes.append(df)
+        else:
+            results = []
+            for reconstruction_time in reconstruction_times:
+
+                result = sc.subduction_convergence(
+                    reconstruction_model.rotation_model,
+                    reconstruction_model.dynamic_polygons,
+                    threshold_sampling_distance_radians,
+                    reconstruction_time,
+                    velocity_delta_time,
+                    anchor_plate_id)
+
+                # Make a flat list of subduction stats to input into the proximity test
+                results.append([data+(reconstruction_time,) for data in result])
+
+        # Build each per-time frame from a single float64 array so that pandas
+        # takes its zero-copy path, rather than inferring dtypes by scanning
+        # a list of tuples row by row; then concatenate into a single dataframe
+        df_AllTimes = pd.concat(
+            [pd.DataFrame(np.asarray(subduction_data, dtype=np.float64).reshape(-1, len(DataFrameTemplate)),
+                          columns=DataFrameTemplate)
+             for subduction_data in results], ignore_index=True)
+        df_AllTimes['subducting_plate'] = df_AllTimes['subducting_plate'].astype(np.int32)
+        df_AllTimes['overriding_plate'] = df_AllTimes['overriding_plate'].astype(np.int32)
 
-        # convert list array to dataframe
         self.df = df_AllTimes
         self.reconstruction_model = reconstruction_model
 
@@ -1059,20 +1196,42 @@ class AgeCodedPointDataset(object):
 
             self._field_mapping = field_mapping
 
+            # Pull the coordinate and age columns out as numpy arrays up front,
+            # which is much faster than row-wise access with df.iterrows
+            lats = self._df[field_mapping['latitude_field']].to_numpy(dtype=np.float64)
+            lons = self._df[field_mapping['longitude_field']].to_numpy(dtype=np.float64)
+            max_ages = self._df[field_mapping['max_age_field']].to_numpy()
+
             self._point_features = []
-            for index,row in self._df.iterrows():
-                point = pygplates.PointOnSphere(float(row[field_mapping['latitude_field']]),
-                                                float(row[field_mapping['longitude_field']]))
+            for index,(lat,lon,max_age) in enumerate(zip(lats,lons,max_ages)):
                 point_feature = pygplates.Feature()
-                point_feature.set_geometry(point)
+                point_feature.set_geometry(pygplates.PointOnSphere(lat,lon))
                 point_feature.set_reconstruction_plate_id(0)
                 try:
-                    point_feature.set_valid_time(row[field_mapping['max_age_field']],-999.)
+                    point_feature.set_valid_time(max_age,-999.)
                 except:
                     warnings.warn('Unable to set valid time for row %d' % index)
                     point_feature.set_valid_time(-998,-999.)
                 self._point_features.append(point_feature)
 
+        self._reconstructed_cache = {}
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """
+        The present-day point coordinates as a shapely 2 point geometry array,
+        built lazily on first access. Useful for plotting and GIS-style
+        operations; the pygplates features remain the storage used for
+        reconstruction.
+        """
+        if self._geometry is None:
+            import shapely
+            self._geometry = shapely.points(
+                self._df[self._field_mapping['longitude_field']].to_numpy(dtype=np.float64),
+                self._df[self._field_mapping['latitude_field']].to_numpy(dtype=np.float64))
+        return self._geometry
+
 
     def assign_reconstruction_model(self, reconstruction_model, polygons='static'):
         """
@@ -1091,23 +1250,37 @@ class AgeCodedPointDataset(object):
                                                                      reconstruction_model.rotation_model,
                                                                      self._point_features)
         self._point_features = partitioned_point_features
+        self._reconstructed_cache = {}
         self.reconstruction_model = reconstruction_model
 
 
+    def _reconstruct(self,reconstruction_time,anchor_plate_id=0):
+        # reconstructions are cached per (time, anchor plate id), so that
+        # repeat plotting or sampling at the same time reuses the result
+        # rather than repeating the pygplates call
+        if not hasattr(self, 'reconstruction_model'):
+            raise ValueError('No reconstruction model assigned, call assign_reconstruction_model first')
+
+        key = (reconstruction_time, anchor_plate_id)
+        if key not in self._reconstructed_cache:
+            reconstructed_features = []
+            pygplates.reconstruct(self._point_features,
+                                  self.reconstruction_model.rotation_model,
+                                  reconstructed_features,
+                                  reconstruction_time,
+                                  anchor_plate_id=anchor_plate_id)
+            self._reconstructed_cache[key] = reconstructed_features
+
+        return self._reconstructed_cache[key]
+
+
     def reconstruct(self,reconstruction_time,anchor_plate_id=0):
         """
         reconstruct point data to specified time (and optionally with specified anchor
         plate id)
         """
 
-        reconstructed_features = []
-        pygplates.reconstruct(self._point_features,
-                              self.reconstruction_model.rotation_model,
-                              reconstructed_features,
-                              reconstruction_time,
-                              anchor_plate_id=anchor_plate_id)
-
-        return reconstructed_features
+        return self._reconstruct(reconstruction_time, anchor_plate_id)
 
 
     def plot_reconstructed(self,reconstruction_time,anchor_plate_id=0):
@@ -1116,18 +1289,19 @@ class AgeCodedPointDataset(object):
         specified anchor plate id)
         """
 
-        reconstructed_features = []
-        pygplates.reconstruct(self._point_features,
-                              self.reconstruction_model.rotation_model,
-                              reconstructed_features,
-                              reconstruction_time,
-                              anchor_plate_id=anchor_plate_id)
+        reconstructed_features = self._reconstruct(reconstruction_time, anchor_plate_id)
 
         plt.figure()
-        for reconstructed_feature in reconstructed_features:
-            plt.plot(reconstructed_feature.get_reconstructed_geometry().to_lat_lon()[1],
-                     reconstructed_feature.get_reconstructed_geometry().to_lat_lon()[0],'ro')
-            plt.axis([-180,180,-90,90])
+        # no points may be valid at the requested time, in which case leave
+        # the plot empty (MultiPointOnSphere cannot be built from no points)
+        if reconstructed_features:
+            # extract all reconstructed coordinates in one call and plot them
+            # with a single matplotlib call, rather than one per point
+            lat_lon_array = pygplates.MultiPointOnSphere(
+                [reconstructed_feature.get_reconstructed_geometry()
+                 for reconstructed_feature in reconstructed_features]).to_lat_lon_array()
+            plt.plot(lat_lon_array[:,1], lat_lon_array[:,0], 'ro')
+        plt.axis([-180,180,-90,90])
         plt.title('%0.2f Ma' % reconstruction_time)
         plt.show()
 
@@ -1137,13 +1311,22 @@ class AgeCodedPointDataset(object):
         Reconstruct points to time of appearance corresponding to each point feature
         """
 
-        rotation_model = pygplates.RotationModel(self.reconstruction_model.rotation_model)
+        # reuse the rotation model if it is already loaded into memory
+        if isinstance(self.reconstruction_model.rotation_model, pygplates.RotationModel):
+            rotation_model = self.reconstruction_model.rotation_model
+        else:
+            rotation_model = pygplates.RotationModel(self.reconstruction_model.rotation_model)
+        # hoist the valid-time extraction out of the loop, and compute all the
+        # reconstruction times in one vectorized step (the reshape keeps the
+        # two time columns when there are no point features at all)
+        valid_times = np.array([point_feature.get_valid_time() for point_feature in self._point_features]).reshape(-1, 2)
+        if ReconstructTime == 'MidTime':
+            reconstruction_times = valid_times.mean(axis=1)
+        else:
+            reconstruction_times = valid_times[:,0]
+
         recon_points = []
-        for point_feature in self._point_features:
-            if ReconstructTime == 'MidTime':
-                reconstruction_time = (point_feature.get_valid_time()[0]+point_feature.get_valid_time()[1])/2.
-            else:
-                reconstruction_time = point_feature.get_valid_time()[0]
+        for point_feature,reconstruction_time in zip(self._point_features,reconstruction_times):
             if point_feature.get_reconstruction_plate_id()!=0:
                 point_rotation = rotation_model.get_rotation(reconstruction_time,
                                                              point_feature.get_reconstruction_plate_id(),
@@ -1171,12 +1354,7 @@ class AgeCodedPointDataset(object):
                                     self._df[self._field_mapping['latitude_field']],
                                     bin_edges)
         else:
-            reconstructed_features = []
-            pygplates.reconstruct(self._point_features,
-                                  self.reconstruction_model.rotation_model,
-                                  reconstructed_features,
-                                  reconstruction_time,
-                                  anchor_plate_id=anchor_plate_id)
+            reconstructed_features = self._reconstruct(reconstruction_time, anchor_plate_id)
 
             result = np.histogram2d([feature.get_reconstructed_geometry().to_lat_lon()[1] for feature in reconstructed_features],
                                     [feature.get_reconstructed_geometry().to_lat_lon()[0] for feature in reconstructed_features],
@@ -1242,9 +1420,23 @@ class PointDistributionOnSphere(object):
         else:
             raise ValueError('unrecognized distribution type ''{:s}'' for PointDistributionOnSphere generation'.format(distribution_type))
 
-        self.multipoint = pygplates.MultiPointOnSphere(zip(self.latitude,self.longitude))
+        self.multipoint = pygplates.MultiPointOnSphere(np.column_stack((self.latitude,self.longitude)))
         self.meshnode_feature = pygplates.Feature(pygplates.FeatureType.create_from_qualified_string('gpml:MeshNode'))
         self.meshnode_feature.set_geometry(self.multipoint)
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """
+        The point distribution as a shapely 2 point geometry array, built
+        lazily on first access. The points are held in a single contiguous
+        GEOS buffer, so plotting and GIS-style operations on them are
+        vectorized rather than passing through one object per point.
+        """
+        if self._geometry is None:
+            import shapely
+            self._geometry = shapely.points(self.longitude, self.latitude)
+        return self._geometry
 
     def to_file(self, filename):
         """
@@ -1288,10 +1480,10 @@ class PointDistributionOnSphere(object):
                                                 return_closest_position = True,
                                                 return_closest_index = True)
 
-        bin_indices = list(zip(*res))[2]
-        bin_counts = []
-        for j in range(len(self.multipoint.get_points())):
-            bin_counts.append(bin_indices.count(j))
+        bin_indices = np.fromiter((r[2] for r in res), dtype=np.int64)
+        # count the points assigned to each bin in a single pass
+        bin_counts = np.bincount(bin_indices,
+                                 minlength=len(self.multipoint.get_points()))
 
         if return_indices:
             return bin_counts, bin_indices
@@ -3,28 +3,185 @@ from pooch import retrieve as _retrieve
 from pooch import HTTPDownloader as _HTTPDownloader
 from pooch import Untar as _Untar
 from pooch import Unzip as _Unzip
+from functools import lru_cache as _lru_cache
 import pandas as _pd
 import geopandas as _gpd
 import os as _os
+import requests as _requests
 
 
-def MagneticPicks(load=True):
+# Shared across all downloads so that urllib3's connection pool can reuse
+# sockets, rather than paying a TCP+TLS handshake for every file fetched
+# from the same host.
+_SESSION = _requests.Session()
+
+
+class _SessionDownloader(_HTTPDownloader):
     '''
-    Magnetic Picks from the 'Global Seafloor Fabric (and) Magnetic Linations' 
-    database, returned as a geopandas dataframe
-    Alternatively, select 'load=False' to return filname of '.gmt' file in 
-    cache folder
+    Variant of pooch's HTTPDownloader that issues requests through the shared
+    module-level session, keeping connections alive between downloads.
+
+    Downloads are streamed in 256 KiB chunks to a destination file opened
+    with a 1 MiB buffer, so the ~100MB+ archives are written with far fewer
+    syscalls than pooch's small default chunks.
+    '''
+
+    def __init__(self, progressbar=False, chunk_size=262144, **kwargs):
+        _HTTPDownloader.__init__(self, progressbar=progressbar,
+                                 chunk_size=chunk_size, **kwargs)
+
+    def __call__(self, url, output_file, pooch, check_only=False):
+        if check_only:
+            response = _SESSION.head(url, allow_redirects=True)
+            return bool(response.status_code == 200)
+
+        kwargs = self.kwargs.copy()
+        timeout = kwargs.pop("timeout", 30)
+        kwargs.setdefault("stream", True)
+        ispath = not hasattr(output_file, "write")
+        if ispath:
+            output_file = open(output_file, "w+b", buffering=1<<20)
+        progress = None
+        try:
+            response = _SESSION.get(url, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            total = int(response.headers.get("content-length", 0))
+            if self.progressbar:
+                try:
+                    from tqdm import tqdm
+                    progress = tqdm(total=total, ncols=79, ascii=True,
+                                    unit="B", unit_scale=True, leave=True)
+                except ImportError:
+                    pass
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    output_file.write(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
+        finally:
+            if progress is not None:
+                progress.close()
+            if ispath:
+                output_file.close()
+
+
+class _BufferedUntar(_Untar):
+    '''
+    Untar processor that reads the archive through a 1 MiB buffered file
+    object, reducing read syscalls on the compressed stream.
+    '''
+
+    def _extract_file(self, fname, extract_dir):
+        import tarfile
+        if self.members is None:
+            with open(fname, 'rb', buffering=1<<20) as archive:
+                with tarfile.open(fileobj=archive, mode='r') as tar_file:
+                    if hasattr(tarfile, 'data_filter'):
+                        # retain the path-traversal sanitization applied by
+                        # Python 3.12+ (and pooch's own Untar)
+                        tar_file.extractall(path=extract_dir, filter="data")
+                    else:
+                        tar_file.extractall(path=extract_dir)
+        else:
+            _Untar._extract_file(self, fname, extract_dir)
+
 
+class _ParallelUnzip(_Unzip):
+    '''
+    Unzip processor that extracts archive members concurrently with a thread
+    pool, overlapping decompression with file I/O on first download.
     '''
-    fname = _retrieve(
+
+    def _extract_file(self, fname, extract_dir):
+        # pooch treats explicit member names as directory prefixes, which
+        # plain ZipFile.extract does not; leave that case to the parent
+        if self.members is not None:
+            _Unzip._extract_file(self, fname, extract_dir)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        from zipfile import ZipFile
+        with ZipFile(fname, "r") as zip_file:
+            members = zip_file.namelist()
+            # pre-create the directory tree serially; concurrent extracts
+            # racing to create the same parent directory can hit the
+            # unsynchronized makedirs inside ZipFile and raise FileExistsError
+            for member in members:
+                dirname = _os.path.dirname(member)
+                if dirname:
+                    _os.makedirs(_os.path.join(extract_dir, dirname), exist_ok=True)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                # consume the iterator so any extraction error is raised here
+                list(executor.map(
+                    lambda member: zip_file.extract(member, path=extract_dir),
+                    members))
+
+
+# The _retrieve calls are cached at module level so that repeat calls to the
+# loader functions skip the hash verification of already-downloaded archives
+# (which can be hundreds of MB). The loaded dataframes are cached separately,
+# keyed on filename and modification time, to avoid redundant GDAL parses.
+
+# Read vector files through pyogrio (with Arrow buffers) where available;
+# it parses geometries in C++ and is typically several times faster than
+# geopandas' default fiona engine.
+try:
+    import pyogrio as _pyogrio  # noqa: F401
+    try:
+        # the Arrow fast path additionally needs pyarrow, which pyogrio
+        # does not pull in by itself
+        import pyarrow as _pyarrow  # noqa: F401
+        _READ_FILE_KWARGS = {'engine': 'pyogrio', 'use_arrow': True}
+    except ImportError:
+        _READ_FILE_KWARGS = {'engine': 'pyogrio'}
+except ImportError:
+    _READ_FILE_KWARGS = {}
+
+
+@_lru_cache(maxsize=None)
+def _load_gdf(fname, mtime):
+    return _gpd.read_file(fname, **_READ_FILE_KWARGS)
+
+
+def _read_file(fname):
+    return _load_gdf(fname, _os.path.getmtime(fname)).copy()
+
+
+@_lru_cache(maxsize=None)
+def _retrieve_magnetic_picks():
+    return _retrieve(
         url="http://www.soest.hawaii.edu/PT/GSFML/ML/DATA/GSFML.global.picks.gmt",
-        known_hash="sha256:0895b76597f600a6c6184a7bec0edc0df5ca9234255f3f7bac0fe944317caf65",  
-        downloader=_HTTPDownloader(progressbar=True),
+        known_hash="sha256:0895b76597f600a6c6184a7bec0edc0df5ca9234255f3f7bac0fe944317caf65",
+        downloader=_SessionDownloader(progressbar=True),
+        path=_os_cache('gprm'),
+    )
+
+
+@_lru_cache(maxsize=None)
+def _retrieve_seafloor_fabric():
+    fnames = _retrieve(
+        url="http://www.soest.hawaii.edu/PT/GSFML/SF/DATA/GSFML_SF.tbz",
+        known_hash="sha256:e27a73dc544611685144b4587d17f03bde24438ee4646963f10761f8ec2e6036",
+        downloader=_SessionDownloader(progressbar=True),
         path=_os_cache('gprm'),
+        processor=_BufferedUntar(),
     )
-    
+    # map the file basenames to their full paths within the cache folder
+    return {_os.path.split(fname)[1]: fname for fname in fnames}
+
+
+def MagneticPicks(load=True):
+    '''
+    Magnetic Picks from the 'Global Seafloor Fabric (and) Magnetic Linations'
+    database, returned as a geopandas dataframe
+    Alternatively, select 'load=False' to return filname of '.gmt' file in
+    cache folder
+
+    '''
+    fname = _retrieve_magnetic_picks()
+
     if load:
-        return _gpd.read_file(fname)
+        return _read_file(fname)
     else:
         return fname
 
@@ -32,14 +189,14 @@ def MagneticPicks(load=True):
 def SeafloorFabric(feature_type='FZ', load=True):
     '''
     Seafloor fabric from the 'Global Seafloor Fabric (and) Magnetic Linations'
-    database, returned as a geopandas dataframe. 
-    Alternatively, select 'load=False' to return filname of '.gmt' file in 
+    database, returned as a geopandas dataframe.
+    Alternatively, select 'load=False' to return filname of '.gmt' file in
     cache folder
 
     Parameters
     ----------
     feature_type (str), choose from one of:
-    
+
     'FZ': Fracture Zones (Kara Matthews)
     'FZLC': Fracture Zones, Less Certainty (Kara Matthews)
     'DZ': Discordant Zones
@@ -53,14 +210,6 @@ def SeafloorFabric(feature_type='FZ', load=True):
     'FZ_RM': from Robert Myhill
     'FZ_MC': from Michael Chandler
     '''
-    fnames = _retrieve(
-        url="http://www.soest.hawaii.edu/PT/GSFML/SF/DATA/GSFML_SF.tbz",
-        known_hash="sha256:e27a73dc544611685144b4587d17f03bde24438ee4646963f10761f8ec2e6036",
-        downloader=_HTTPDownloader(progressbar=True),
-        path=_os_cache('gprm'),
-        processor=_Untar(),
-    )
-    
     FABRIC_TYPE = {
         "FZ": "GSFML_SF_FZ_KM.gmt",
         "FZLC": "GSFML_SF_FZLC_KM.gmt",
@@ -77,12 +226,47 @@ def SeafloorFabric(feature_type='FZ', load=True):
     if feature_type not in FABRIC_TYPE.keys():
         raise ValueError('Unknown feature type {:s}'.format(feature_type))
 
-    for fname in fnames:
-        if _os.path.split(fname)[1]==FABRIC_TYPE[feature_type]:
-            if load:
-                return _gpd.read_file(fname)
-            else:
-                return fname
+    fname = _retrieve_seafloor_fabric()[FABRIC_TYPE[feature_type]]
+
+    if load:
+        return _read_file(fname)
+    else:
+        return fname
+
+
+@_lru_cache(maxsize=None)
+def _retrieve_pacific_seamount_ages():
+    return _retrieve(
+        url="https://www.earthbyte.org/webdav/gmt_mirror/gmt/data/cache/Pacific_Ages.txt",
+        known_hash="sha256:8c5e57b478c2c2f5581527c7aea5ef282e976c36c5e00452210885a92e635021",
+        downloader=_SessionDownloader(progressbar=True),
+        path=_os_cache('gprm'),
+    )
+
+
+# The seamount tables are whitespace-delimited with run-length padding, which
+# Arrow's CSV tokenizer cannot split; parsing stays on pandas' C engine but
+# the resulting GeoDataFrames are memoized so each file is parsed only once
+# per process.
+
+@_lru_cache(maxsize=None)
+def _load_pacific_seamount_ages(fname, mtime):
+    df = _pd.read_csv(fname, comment='#', sep=r'\s+',
+                      names=['Long', 'Lat', 'Average_Age_Ma', 'Average_Age_Error_Ma', 'Tag', 'SeamountName', 'SeamountChain'])
+    return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
+
+
+@_lru_cache(maxsize=None)
+def _load_seamounts_kim_wessel(fname, mtime):
+    df = _pd.read_csv(fname, sep=r'\s+', skiprows=17, comment='>',
+            names=['Long', 'Lat', 'Azimuth', 'Major', 'Minor', 'Height', 'FAA', 'VGG', 'Depth', 'CrustAge', 'ID'])
+    return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
+
+
+@_lru_cache(maxsize=None)
+def _load_seamounts_hillier_watts(fname, mtime):
+    df = _pd.read_csv(fname, sep=r'\s+', names=['Long', 'Lat', 'Height'])
+    return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
 
 
 def PacificSeamountAges(load=True):
@@ -90,52 +274,52 @@ def PacificSeamountAges(load=True):
     Pacific Seamount Age compilation from GMT website
 
     '''
-    fname = _retrieve(
-        url="https://www.earthbyte.org/webdav/gmt_mirror/gmt/data/cache/Pacific_Ages.txt",
-        known_hash="sha256:8c5e57b478c2c2f5581527c7aea5ef282e976c36c5e00452210885a92e635021",  
-        downloader=_HTTPDownloader(progressbar=True),
-        path=_os_cache('gprm'),
-    )
-    
+    fname = _retrieve_pacific_seamount_ages()
+
     if load:
-        df = _pd.read_csv(fname, comment='#', delim_whitespace=True,
-                          names=['Long', 'Lat', 'Average_Age_Ma', 'Average_Age_Error_Ma', 'Tag', 'SeamountName', 'SeamountChain'])
-        return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
+        return _load_pacific_seamount_ages(fname, _os.path.getmtime(fname)).copy()
     else:
         return fname
 
 
+@_lru_cache(maxsize=None)
+def _retrieve_seamounts_kim_wessel():
+    return _retrieve(
+        url="http://www.soest.hawaii.edu/PT/SMTS/kwsmts/KWSMTSv01.txt",
+        known_hash="sha256:91c93302c44463a424835aa4051b7b2a1ea04d6675d928ca8405b231ae7cea9a",
+        downloader=_SessionDownloader(progressbar=True),
+        path=_os_cache('gprm'),
+    )
+
+
+@_lru_cache(maxsize=None)
+def _retrieve_seamounts_hillier_watts():
+    return _retrieve(
+        url="https://www.wattsgeophysics.co.uk/downloadfile/5616459",
+        known_hash="sha256:d0b9aa7d15754ad9aabecfedf881005d22254e79183af8edf0806be840a549ac",
+        downloader=_SessionDownloader(progressbar=True),
+        path=_os_cache('gprm'),
+    )
+
+
 def Seamounts(catalogue='KimWessel', load=True):
     '''
     Seamount Census from Kim and Wessel
 
     '''
     if catalogue in ['KimWessel', 'KW']:
-        fname = _retrieve(
-            url="http://www.soest.hawaii.edu/PT/SMTS/kwsmts/KWSMTSv01.txt",
-            known_hash="sha256:91c93302c44463a424835aa4051b7b2a1ea04d6675d928ca8405b231ae7cea9a",  
-            downloader=_HTTPDownloader(progressbar=True),
-            path=_os_cache('gprm'),
-        )
-        
+        fname = _retrieve_seamounts_kim_wessel()
+
         if load:
-            df = _pd.read_csv(fname, delim_whitespace=True, skiprows=17, comment='>', 
-                    names=['Long', 'Lat', 'Azimuth', 'Major', 'Minor', 'Height', 'FAA', 'VGG', 'Depth', 'CrustAge', 'ID'])
-            return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
+            return _load_seamounts_kim_wessel(fname, _os.path.getmtime(fname)).copy()
         else:
             return fname
 
     elif catalogue in ['HillierWatts', 'HW']:
-        fname = _retrieve(
-            url="https://www.wattsgeophysics.co.uk/downloadfile/5616459",
-            known_hash="sha256:d0b9aa7d15754ad9aabecfedf881005d22254e79183af8edf0806be840a549ac",  
-            downloader=_HTTPDownloader(progressbar=True),
-            path=_os_cache('gprm'),
-        )
+        fname = _retrieve_seamounts_hillier_watts()
 
         if load:
-            df = _pd.read_csv(fname, delim_whitespace=True, names=['Long', 'Lat', 'Height'])
-            return _gpd.GeoDataFrame(df, geometry=_gpd.points_from_xy(df.Long, df.Lat))
+            return _load_seamounts_hillier_watts(fname, _os.path.getmtime(fname)).copy()
         else:
             return fname
 
@@ -143,6 +327,30 @@ def Seamounts(catalogue='KimWessel', load=True):
         raise ValueError('Unknown catalogue {:s}'.format(catalogue))
 
 
+@_lru_cache(maxsize=None)
+def _retrieve_gplates_lips():
+    fnames = _retrieve(
+            url="https://www.earthbyte.org/webdav/ftp/earthbyte/GPlates/SampleData_GPlates2.2/Individual/FeatureCollections/LargeIgneousProvinces_VolcanicProvinces.zip",
+            known_hash="sha256:8f86ab86a12761f5534beaaeaddbed5b4e3e6d3d9b52b0c87ee9b15af2a797cd",
+            downloader=_SessionDownloader(progressbar=True),
+            path=_os_cache('gprm'),
+            processor=_ParallelUnzip(),
+        )
+
+    return next(_os.path.split(fname)[0] for fname in fnames
+                if _os.path.split(fname)[1] == 'License.txt')
+
+
+@_lru_cache(maxsize=None)
+def _retrieve_utig_lips():
+    return _retrieve(
+            url="http://www-udc.ig.utexas.edu/external/plates/data/LIPS/Data/LIPS.2011.gmt",
+            known_hash="sha256:11cd037382c518ec0b54b93728fef5e476ec3d8d57e5c433a1ccf14420ee99dd",
+            downloader=_SessionDownloader(progressbar=True),
+            path=_os_cache('gprm'),
+        )
+
+
 def LargeIgneousProvinces(catalogue='Whittaker', load=True):
     '''
     (Large) Igneous Province polygons included in GPlates sample data:
@@ -153,17 +361,7 @@ def LargeIgneousProvinces(catalogue='Whittaker', load=True):
 
     '''
     if catalogue in ['Whittaker', 'Johansson']:
-        fnames = _retrieve(
-                url="https://www.earthbyte.org/webdav/ftp/earthbyte/GPlates/SampleData_GPlates2.2/Individual/FeatureCollections/LargeIgneousProvinces_VolcanicProvinces.zip",
-                known_hash="sha256:8f86ab86a12761f5534beaaeaddbed5b4e3e6d3d9b52b0c87ee9b15af2a797cd",  
-                downloader=_HTTPDownloader(progressbar=True),
-                path=_os_cache('gprm'),
-                processor=_Unzip(),
-            )
-
-        for fname in fnames:
-            if _os.path.split(fname)[1] == 'License.txt':
-                dirname = _os.path.split(fname)[0]
+        dirname = _retrieve_gplates_lips()
 
         if catalogue=='Whittaker':
             fname='{:s}/LargeIgneousProvinces_VolcanicProvinces/Whittaker_etal_2015_LargeIgneousProvinces/SHP/Whittaker_etal_2015_LIPs.shp'.format(dirname)
@@ -171,18 +369,12 @@ def LargeIgneousProvinces(catalogue='Whittaker', load=True):
             fname='{:s}/LargeIgneousProvinces_VolcanicProvinces/Johansson_etal_2018_VolcanicProvinces/SHP/Johansson_etal_2018_VolcanicProvinces_v2.shp'.format(dirname)
 
     elif catalogue=='UTIG':
-        fname = _retrieve(
-                url="http://www-udc.ig.utexas.edu/external/plates/data/LIPS/Data/LIPS.2011.gmt",
-                known_hash="sha256:11cd037382c518ec0b54b93728fef5e476ec3d8d57e5c433a1ccf14420ee99dd",  
-                downloader=_HTTPDownloader(progressbar=True),
-                path=_os_cache('gprm'),
-            )
+        fname = _retrieve_utig_lips()
 
     else:
         raise ValueError('Unknown catalogue {:s}'.format(catalogue))
 
     if load:
-        return _gpd.read_file(fname)
+        return _read_file(fname)
     else:
         return fname
-
@@ -362,7 +362,7 @@ def paleotopography_job(reconstruction_time, paleogeography_timeslice_list,
 
         # get index for grid nodes where age grid is nan, replace values with topography/shallow bathymetry
         land_or_ocean_precedence = 'land'
-        if land_or_ocean_precedence is 'ocean':
+        if land_or_ocean_precedence == 'ocean':
             not_bathy_index = np.isnan(paleodepth)
             paleodepth[not_bathy_index] = topoZ[not_bathy_index]
         else:
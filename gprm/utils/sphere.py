@@ -62,14 +62,12 @@ def points_on_sphere(N, distribution_type='marsaglia'):
     else:
         raise ValueError('unrecognised method for point on sphere generation')
 
-    Long=[]
-    Lat=[]
-    for xyz in points.T:
-        LL = pygplates.PointOnSphere((xyz))
-        Lat.append(LL.to_lat_lon()[0])
-        Long.append(LL.to_lat_lon()[1])
-
-    return np.array(Long), np.array(Lat)
+    # convert all xyz points to lat/lon with vectorized ufuncs, avoiding
+    # any per-point object construction
+    Long = np.degrees(np.arctan2(points[1], points[0]))
+    Lat = np.degrees(np.arcsin(np.clip(points[2], -1., 1.)))
+
+    return Long, Lat
 
 
 def random_points_feature(N,filename=None):